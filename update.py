@@ -2,20 +2,25 @@
 
 from __future__ import print_function
 
+import ast
 import datetime
+import functools
 import hashlib
+import json
 import os
+import pickle
+import re
 import shutil
 import subprocess
 import sys
-from io import StringIO
+import textwrap
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from optparse import OptionParser
+from urllib.request import urlopen
 
 import appdirs
 from collections import defaultdict
 
-from orderedsets import OrderedSet
-
 work_trees_to_look_at = "main", "develop", "factory"
 
 cache_dir = appdirs.user_cache_dir("Nuitka-Speedcenter", None)
@@ -27,45 +32,116 @@ if not os.path.exists(git_dir):
 clone_dir = os.path.join(git_dir, "Nuitka.git")
 
 
-def executeCommand(command):
+def executeCommand(command, cwd=None):
     print("Execute: ", command)
 
-    assert 0 == os.system(command)
+    subprocess.run(command, cwd=cwd, check=True)
 
 
+@functools.lru_cache(maxsize=None)
 def getNuitkaWorkTreeDir(work_tree):
     return os.path.join(git_dir, work_tree)
 
 
 def makedirs(path, mode=0o755):
-    if not os.path.isdir(path):
-        os.makedirs(path, mode)
+    os.makedirs(path, mode, exist_ok=True)
 
 
 def updateNuitkaSoftware():
+    # Returns True if any branch actually changed, so no-change runs can
+    # skip the downstream work.
+    changed = False
+
     if not os.path.exists(clone_dir):
+        changed = True
+
         makedirs(git_dir)
 
         executeCommand(
-            "cd '%s'; git clone --bare --mirror https://github.com/Nuitka/Nuitka.git"
-            % git_dir
+            ["git", "clone", "--bare", "--mirror", "https://github.com/Nuitka/Nuitka.git"],
+            cwd=git_dir,
         )
     else:
-        executeCommand("cd '%s'; git fetch -p" % clone_dir)
+        executeCommand(["git", "fetch", "-p"], cwd=clone_dir)
+
+    # The fetch may have moved branches resolved before.
+    _getBranchCommitIds.cache_clear()
+
+    # Last commit ids the worktrees were put to, so unchanged branches need
+    # no git invocation at all.
+    worktree_state_filename = os.path.join(cache_dir, "worktree-state.json")
+
+    try:
+        with open(worktree_state_filename) as state_file:
+            worktree_state = json.load(state_file)
+    except (IOError, ValueError):
+        worktree_state = {}
+
+    branch_commits = getCommitIds(work_trees_to_look_at)
 
     for work_tree in work_trees_to_look_at:
         work_tree_dir = getNuitkaWorkTreeDir(work_tree)
 
+        commit_id = branch_commits[work_tree]
+
         if not os.path.exists(work_tree_dir):
+            changed = True
+
             executeCommand(
-                "cd '%s'; git worktree add '%s' '%s'"
-                % (clone_dir, work_tree_dir, work_tree)
+                ["git", "worktree", "add", work_tree_dir, work_tree],
+                cwd=clone_dir,
             )
-        else:
+        elif worktree_state.get(work_tree) != commit_id:
+            changed = True
+
             executeCommand(
-                "cd '%s'; git reset --hard '%s'" % (work_tree_dir, work_tree)
+                ["git", "reset", "--hard", work_tree], cwd=work_tree_dir
             )
 
+        worktree_state[work_tree] = commit_id
+
+    with open(worktree_state_filename, "w") as state_file:
+        json.dump(worktree_state, state_file)
+
+    return changed
+
+
+# Templates used in graph and RST generation, parsed only once rather than
+# per formatting call.
+_graph_template = """
+.. chart:: Bar
+    :title: '{graph_title}'
+    :x_labels: {graph_x_labels}
+
+    'Ticks', {graph_values}
+    """
+
+_construct_header_template = """\
+.. title: Construct {construct_name}
+.. tags: {construct_tags}
+.. date: {date}
+
+.. contents::
+"""
+
+_diagrams_header = """
+Performance Diagrams
+====================
+
+"""
+
+_source_section_template = """
+{section_title}
+{section_underline}
+
+.. code-block:: python
+
+{source_code}
+"""
+
+# All three construct markers found in one scan per source line.
+_construct_marker_re = re.compile(r"# construct_(begin|alternative|end)")
+
 
 def generateConstructGraph(
     name,
@@ -77,8 +153,6 @@ def generateConstructGraph(
     nuitka_develop_value = graph_data["develop"]
     nuitka_factory_value = graph_data["factory"]
 
-    graph_title = "Construct %s" % name
-
     graph_values = [
         cpython_value,
         nuitka_main_value,
@@ -94,23 +168,19 @@ def generateConstructGraph(
     ]
 
     # Also return the rest for pygal plug-in:
-    return """
-.. chart:: Bar
-    :title: '%(graph_title)s'
-    :x_labels: %(graph_x_labels)s
-
-    'Ticks', %(graph_values)s
-    """ % {
-        "graph_title": graph_title,
-        "graph_x_labels": repr(graph_x_labels),
-        "graph_values": repr(graph_values),
-    }
+    return _graph_template.format(
+        graph_title="Construct %s" % name,
+        graph_x_labels=repr(graph_x_labels),
+        graph_values=repr(graph_values),
+    )
 
 
+@functools.lru_cache(maxsize=None)
 def getHomeDir():
     return os.path.normpath(os.path.dirname(__file__))
 
 
+@functools.lru_cache(maxsize=None)
 def getDataDir():
     data_dir = os.path.join(cache_dir, "performance-data")
 
@@ -119,26 +189,33 @@ def getDataDir():
     return data_dir
 
 
+def _fetchDoc(filename):
+    url = (
+        "https://nuitka.net/gitweb/?p=Nuitka.git;a=blob_plain;f=%s;hb=refs/heads/factory"
+        % filename
+    )
+
+    # Stream to disk in 64K chunks, no full copy in memory.
+    with urlopen(url, timeout=30) as response, open(filename, "wb") as out_file:
+        shutil.copyfileobj(response, out_file, length=1 << 16)
+
+
 def fetchDocs():
     makedirs("doc/images")
 
     # TODO: We only use one of those really here, and it could become a
     # reference to nuitka.net
-    for filename in (
+    filenames = (
         "doc/images/Nuitka-Logo-Horizontal.png",
         "doc/images/Nuitka-Logo-Vertical.png",
         "doc/images/Nuitka-Logo-Symbol.png",
-    ):
-        command = (
-            "curl -s https://nuitka.net/gitweb/?p=Nuitka.git;a=blob_plain;f=%s;hb=refs/heads/factory"
-            % filename
-        )
-        output = subprocess.check_output(command.split())
+    )
 
-        with open(filename, "wb") as out_file:
-            out_file.write(output)
+    with ThreadPoolExecutor(max_workers=len(filenames)) as executor:
+        list(executor.map(_fetchDoc, filenames))
 
 
+@functools.lru_cache(maxsize=None)
 def getSourcesDir():
     sources_dir = os.path.join(getDataDir(), "construct-sources")
 
@@ -147,46 +224,169 @@ def getSourcesDir():
     return sources_dir
 
 
+@functools.lru_cache(maxsize=None)
 def getPythonVersions():
     data_dir = getDataDir()
 
-    return sorted(
-        [
-            python_version
-            for python_version in sorted(os.listdir(data_dir))
-            if python_version != "construct-sources"
-        ],
+    with os.scandir(data_dir) as scan:
+        python_versions = [
+            entry.name for entry in scan if entry.name != "construct-sources"
+        ]
+
+    python_versions.sort(
         key=lambda python_version: tuple(int(x) for x in python_version.split(".")),
         reverse=True,
     )
 
+    # Immutable, it is shared through the cache.
+    return tuple(python_versions)
 
-def readDataFile(filename):
-    values = {}
 
-    if os.path.exists(filename):
-        # There was a bug, where Scons output was done even if used --quiet.
-        code = "".join(
-            line for line in open(filename, "r") if "Nuitka-Scons:" not in line
+@functools.lru_cache(maxsize=None)
+def _readDataFileCached(filename, mtime_ns, size):
+    # The stat values are only part of the signature, so changed files are
+    # re-read while unchanged ones come out of the cache.
+    # pylint: disable=unused-argument
+
+    with open(filename, "r") as data_file:
+        code = data_file.read()
+
+    # There was a bug, where Scons output was done even if used --quiet. In
+    # the common case there is none, one substring scan and no line filter.
+    if "Nuitka-Scons:" in code:
+        code = "\n".join(
+            line for line in code.split("\n") if "Nuitka-Scons:" not in line
         )
 
+    # Data files consist only of "NAME = literal" assignments, walk them
+    # with the ast module, no need for a real Python execution.
+    values = {}
+
+    try:
+        for node in ast.parse(code).body:
+            if (
+                isinstance(node, ast.Assign)
+                and len(node.targets) == 1
+                and isinstance(node.targets[0], ast.Name)
+            ):
+                values[node.targets[0].id] = ast.literal_eval(node.value)
+    except (SyntaxError, ValueError):
+        return None
+
+    return values
+
+
+# Parsed data file values persisted across runs, keyed by path with
+# (mtime, size) for invalidation. Not stored next to the data files, the
+# cleanup walk owns those directories.
+_data_file_cache_filename = os.path.join(cache_dir, "data-file-cache.json")
+_data_file_cache = None
+_data_file_cache_dirty = False
+
+# Entries parsed by this process only. Pool workers cannot write the shared
+# cache themselves, they hand these back for the parent to merge.
+_data_file_cache_updates = {}
+
+
+def _getDataFileCache():
+    # singleton, pylint: disable=global-statement
+    global _data_file_cache
+
+    if _data_file_cache is None:
         try:
-            exec(code, values)
-        except ValueError:
-            return None
+            with open(_data_file_cache_filename) as cache_file:
+                _data_file_cache = json.load(cache_file)
+        except (IOError, ValueError):
+            _data_file_cache = {}
 
-        del values["__builtins__"]
-        return values
-    else:
+    return _data_file_cache
+
+
+def saveDataFileCache():
+    if _data_file_cache_dirty:
+        with open(_data_file_cache_filename, "w") as cache_file:
+            json.dump(_data_file_cache, cache_file)
+
+
+def _takeDataFileCacheUpdates():
+    updates = dict(_data_file_cache_updates)
+    _data_file_cache_updates.clear()
+
+    return updates
+
+
+def _mergeDataFileCacheUpdates(updates):
+    if not updates:
+        return
+
+    # singleton, pylint: disable=global-statement
+    global _data_file_cache_dirty
+
+    _getDataFileCache().update(updates)
+    _data_file_cache_dirty = True
+
+
+def readDataFile(filename):
+    if not os.path.exists(filename):
         return None
 
+    file_stat = os.stat(filename)
+
+    cache = _getDataFileCache()
+    cache_entry = cache.get(filename)
+
+    if (
+        cache_entry is not None
+        and cache_entry["mtime"] == file_stat.st_mtime_ns
+        and cache_entry["size"] == file_stat.st_size
+    ):
+        return cache_entry["values"]
+
+    values = _readDataFileCached(filename, file_stat.st_mtime_ns, file_stat.st_size)
+
+    if values is not None:
+        # singleton, pylint: disable=global-statement
+        global _data_file_cache_dirty
+
+        cache[filename] = {
+            "mtime": file_stat.st_mtime_ns,
+            "size": file_stat.st_size,
+            "values": values,
+        }
+        _data_file_cache_updates[filename] = cache[filename]
+
+        _data_file_cache_dirty = True
+
+    return values
+
+
+def getFileHash(filename):
+    # Note: Has to remain md5, that is what the measurement runner puts
+    # into the data files as TEST_CASE_HASH.
+    with open(filename, "rb", buffering=1 << 17) as data_file:
+        if hasattr(hashlib, "file_digest"):
+            # Python3.11+, hashes from a reusable buffer without creating
+            # a bytes object of the whole file.
+            return hashlib.file_digest(data_file, "md5").hexdigest()
+
+        digest = hashlib.md5()
 
-def makeTag(python_version, case_data, version1, version2):
-    python_version_prefix = python_version.replace(".", "")
+        while True:
+            chunk = data_file.read(1 << 20)
+
+            if not chunk:
+                break
+
+            digest.update(chunk)
+
+        return digest.hexdigest()
+
+
+def makeTag(python_version_prefix, case_data, version1, version2):
+    # The caller builds case_data with all branch keys present, no need to
+    # re-check that per call.
     key = (python_version_prefix, version2, version1)
 
-    assert version1 in case_data, (version1, case_data)
-    assert version2 in case_data, (version2, case_data)
     if isLessTicksThan(case_data[version2], case_data[version1]):
         return "%s_%s_down_vs_%s" % key
     elif isLessTicksThan(case_data[version1], case_data[version2]):
@@ -195,73 +395,114 @@ def makeTag(python_version, case_data, version1, version2):
         return "%s_%s_steady_vs_%s" % key
 
 
+def _getDataTreeFingerprint():
+    # Stat-only sweep over the data tree, catches added, removed and
+    # rewritten files without reading any of them.
+    fingerprint = 0
+
+    for dirpath, _dirnames, filenames in os.walk(getDataDir()):
+        for filename in filenames:
+            file_stat = os.stat(os.path.join(dirpath, filename))
+
+            fingerprint += file_stat.st_mtime_ns + file_stat.st_size
+
+    return fingerprint
+
+
 def getConstructGraphData():
     data_dir = getDataDir()
 
+    # The parsed result only depends on the data tree, keep it pickled
+    # and keyed by a tree fingerprint, so unchanged runs skip all the
+    # per-file parsing. New measurements change the fingerprint and so
+    # invalidate the cache by themselves.
+    cache_filename = os.path.join(cache_dir, "graph-data.pickle")
+    fingerprint = _getDataTreeFingerprint()
+
+    try:
+        with open(cache_filename, "rb") as cache_file:
+            cached_fingerprint, cached_result = pickle.load(cache_file)
+
+        if cached_fingerprint == fingerprint:
+            return cached_result
+    except (IOError, EOFError, pickle.UnpicklingError, ValueError):
+        pass
+
     graph_data = {}
 
     python_versions = getPythonVersions()
 
     construct_names = set()
 
-    tags = defaultdict(OrderedSet)
+    # Insertion ordered and unique, a plain dict with None values does what
+    # OrderedSet did without the extra dependency.
+    tags = defaultdict(dict)
 
     for python_version in python_versions:
-        main_data_dir = os.path.join(data_dir, python_version, "main")
-
-        develop_data_dir = os.path.join(data_dir, python_version, "develop")
+        python_version_prefix = python_version.replace(".", "")
 
-        factory_data_dir = os.path.join(data_dir, python_version, "factory")
+        version_data_dir = os.path.join(data_dir, python_version)
 
-        cpython_data_dir = os.path.join(data_dir, python_version, "cpython")
+        branch_data_dirs = {
+            branch: os.path.join(version_data_dir, branch)
+            for branch in ("cpython", "main", "develop", "factory")
+        }
 
-        for entry in sorted(os.listdir(main_data_dir)):
-            if not entry.endswith(".data"):
-                continue
+        with os.scandir(branch_data_dirs["main"]) as scan:
+            data_entries = sorted(
+                entry.name for entry in scan if entry.name.endswith(".data")
+            )
 
+        for entry in data_entries:
             construct_name = entry.split(".")[0]
             construct_names.add(construct_name)
 
-            cpython_values = readDataFile(os.path.join(cpython_data_dir, entry))
-
-            factory_values = readDataFile(os.path.join(factory_data_dir, entry))
-
-            develop_values = readDataFile(os.path.join(develop_data_dir, entry))
-
-            main_values = readDataFile(os.path.join(main_data_dir, entry))
+            case_values = {
+                branch: readDataFile(os.path.join(branch_data_dir, entry))
+                for branch, branch_data_dir in branch_data_dirs.items()
+            }
 
             graph_data[python_version, construct_name] = dict(
-                cpython=cpython_values["CPYTHON_CONSTRUCT"],
-                main=main_values["NUITKA_CONSTRUCT"],
-                develop=develop_values["NUITKA_CONSTRUCT"],
-                factory=factory_values["NUITKA_CONSTRUCT"],
+                cpython=case_values["cpython"]["CPYTHON_CONSTRUCT"],
+                main=case_values["main"]["NUITKA_CONSTRUCT"],
+                develop=case_values["develop"]["NUITKA_CONSTRUCT"],
+                factory=case_values["factory"]["NUITKA_CONSTRUCT"],
             )
 
-            tags[construct_name].add(
+            tags[construct_name][
                 makeTag(
-                    python_version=python_version,
+                    python_version_prefix=python_version_prefix,
                     case_data=graph_data[python_version, construct_name],
                     version1="main",
                     version2="develop",
                 )
-            )
-            tags[construct_name].add(
+            ] = None
+            tags[construct_name][
                 makeTag(
-                    python_version=python_version,
+                    python_version_prefix=python_version_prefix,
                     case_data=graph_data[python_version, construct_name],
                     version1="develop",
                     version2="factory",
-                ),
-            )
+                )
+            ] = None
+
+    result = python_versions, construct_names, graph_data, tags
 
-    return python_versions, construct_names, graph_data, tags
+    with open(cache_filename, "wb") as cache_file:
+        pickle.dump((fingerprint, result), cache_file)
+
+    return result
 
 
 def isLessTicksThan(value1, value2):
-    if abs(value1 - value2) / float(value1) < 0.001:
+    diff = abs(value1 - value2)
+
+    # Cheap integer compare first, the float division only happens for
+    # differences above the absolute noise floor.
+    if diff < 1000:
         return False
 
-    if abs(value1 - value2) < 1000:
+    if diff / float(value1) < 0.001:
         return False
 
     return value1 < value2
@@ -274,133 +515,162 @@ assert isLessTicksThan(99858, 99542) is False
 assert isLessTicksThan(99542, 99858) is False
 
 
-def updateConstructGraphs():
-    python_versions, construct_names, graph_data, tags = getConstructGraphData()
+def _writeConstructRst(
+    construct_name, construct_tags, version_data, python_versions, constructs_dir
+):
+    construct_rst = os.path.join(constructs_dir, "construct-%s.rst" % construct_name)
+
+    construct_filename = os.path.join(getSourcesDir(), construct_name + ".py")
+
+    # Signature over everything that feeds the file, so unchanged
+    # constructs are not rewritten at all. The wallclock date line is
+    # deliberately not part of it; it only gets refreshed when the
+    # content changed anyway.
+    signature = hashlib.sha1(
+        repr(
+            (
+                ",".join(construct_tags or ["untagged"]),
+                sorted(version_data.items()),
+                os.stat(construct_filename).st_mtime_ns,
+            )
+        ).encode()
+    ).hexdigest()
 
-    home_dir = getHomeDir()
+    signature_filename = construct_rst + ".sig"
 
-    graphs = {}
+    if os.path.exists(construct_rst):
+        try:
+            with open(signature_filename) as signature_file:
+                if signature_file.read() == signature:
+                    return
+        except IOError:
+            pass
+
+    parts = [
+        _construct_header_template.format(
+            construct_name=construct_name,
+            construct_tags=",".join(construct_tags or ["untagged"]),
+            date=datetime.datetime.now().strftime("%m/%d/%Y, %H:%M:%S"),
+        ),
+        _diagrams_header,
+    ]
 
     for python_version in python_versions:
-        for construct_name in construct_names:
-            if (python_version, construct_name) in graph_data:
-                graphs[python_version, construct_name] = generateConstructGraph(
+        if python_version in version_data:
+            parts.append(
+                generateConstructGraph(
                     name=construct_name,
                     python_version=python_version,
-                    graph_data=graph_data[python_version, construct_name],
+                    graph_data=version_data[python_version],
                 )
+            )
 
-    for construct_name in sorted(construct_names):
-        construct_tags = tags[construct_name]
-
-        construct_rst = os.path.join(
-            home_dir, "constructs", "construct-%s.rst" % construct_name
-        )
-
-        makedirs(os.path.dirname(construct_rst))
-
-        for python_version in python_versions:
-            key = python_version, construct_name
-
-            if key not in graph_data:
-                continue
-
-        with open(construct_rst, "w") as construct_file:
-            construct_file.write(
-                """\
-.. title: Construct %s
-.. tags: %s
-.. date: %s
+    with open(construct_filename, buffering=1 << 17) as source_file:
+        source_lines = source_file.read().splitlines()
 
-.. contents::
-"""
-                % (
-                    construct_name,
-                    ",".join(construct_tags or ["untagged"]),
-                    datetime.datetime.now().strftime("%m/%d/%Y, %H:%M:%S"),
-                )
-            )
+    begin_index = alternative_index = end_index = None
 
-            construct_file.write(
-                """
-Performance Diagrams
-====================
+    for line_number, line in enumerate(source_lines):
+        match = _construct_marker_re.search(line)
 
-"""
-            )
-            for python_version in python_versions:
-                key = python_version, construct_name
+        if match is None:
+            continue
 
-                if key in graphs:
-                    construct_file.write(graphs[key])
+        marker = match.group(1)
 
-            construct_filename = os.path.join(getSourcesDir(), construct_name + ".py")
+        if marker == "begin":
+            begin_index = line_number
+        elif marker == "alternative":
+            alternative_index = line_number
+        else:
+            end_index = line_number
+
+    # Blank lines pad the removed case, keeping line numbers of the
+    # two variants aligned.
+    if begin_index is None or end_index is None:
+        # Sources without markers cannot be split, show the full source in
+        # both sections rather than failing the whole generation.
+        case_1_lines = source_lines
+        case_2_lines = source_lines
+    elif alternative_index is not None:
+        case_1_lines = (
+            source_lines[: alternative_index + 1]
+            + [""] * (end_index - alternative_index)
+            + source_lines[end_index + 1 :]
+        )
 
-            case_1_file = StringIO()
-            case_2_file = StringIO()
+        case_2_lines = (
+            source_lines[: begin_index + 1]
+            + [""] * (alternative_index - begin_index - 1)
+            + source_lines[alternative_index : end_index + 1]
+            + source_lines[end_index + 1 :]
+        )
+    else:
+        case_1_lines = source_lines
 
-            inside = False
-            case = 0
+        case_2_lines = (
+            source_lines[: begin_index + 1]
+            + [""] * (end_index - begin_index)
+            + source_lines[end_index + 1 :]
+        )
 
-            for line in open(construct_filename):
-                if not inside or case == 1:
-                    case_1_file.write(line)
-                else:
-                    case_1_file.write("\n")
+    parts.append(
+        _source_section_template.format(
+            section_title="Source Code with Construct",
+            section_underline="==========================",
+            source_code=textwrap.indent("\n".join(case_1_lines[19:]), "    "),
+        )
+    )
+    parts.append(
+        _source_section_template.format(
+            section_title="Source Code without Construct",
+            section_underline="=============================",
+            source_code=textwrap.indent("\n".join(case_2_lines[19:]), "    "),
+        )
+    )
 
-                if "# construct_alternative" in line:
-                    case = 2
+    with open(construct_rst, "w") as construct_file:
+        construct_file.write("".join(parts))
 
-                if not inside or case == 2:
-                    case_2_file.write(line)
-                else:
-                    case_2_file.write("\n")
+    with open(signature_filename, "w") as signature_file:
+        signature_file.write(signature)
 
-                if "# construct_begin" in line:
-                    inside = True
-                    case = 1
-                elif "# construct_end" in line:
-                    inside = False
-                    case = 1
 
-            case_1 = case_1_file.getvalue()
-            case_1_file.close()
+def updateConstructGraphs():
+    python_versions, construct_names, graph_data, tags = getConstructGraphData()
 
-            case_2 = case_2_file.getvalue()
-            case_2_file.close()
+    home_dir = getHomeDir()
 
-            construct_file.write(
-                """
-Source Code with Construct
-==========================
+    # Group by construct in one pass, instead of probing every
+    # (python version, construct) pair.
+    data_by_construct = defaultdict(dict)
 
-.. code-block:: python
+    for (python_version, construct_name), case_data in graph_data.items():
+        data_by_construct[construct_name][python_version] = case_data
 
-%s
-"""
-                % (
-                    "\n".join(
-                        ("    " + line) if line else ""
-                        for line in case_1.split("\n")[19:]
-                    )
-                )
-            )
-            construct_file.write(
-                """
-Source Code without Construct
-=============================
+    constructs_dir = os.path.join(home_dir, "constructs")
+    makedirs(constructs_dir)
 
-.. code-block:: python
+    sorted_names = sorted(construct_names)
 
-%s
-"""
-                % (
-                    "\n".join(
-                        ("    " + line) if line else ""
-                        for line in case_2.split("\n")[19:]
-                    )
-                )
+    # Every construct writes only its own RST and signature file, so the
+    # generation spreads over the cores just like the measurements do.
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        list(
+            executor.map(
+                functools.partial(
+                    _writeConstructRst,
+                    python_versions=python_versions,
+                    constructs_dir=constructs_dir,
+                ),
+                sorted_names,
+                (list(tags[construct_name]) for construct_name in sorted_names),
+                (
+                    data_by_construct[construct_name]
+                    for construct_name in sorted_names
+                ),
             )
+        )
 
     index_dir = os.path.join(home_dir, "index")
     makedirs(index_dir)
@@ -422,7 +692,7 @@ The following Python construct test cases exist so far:
 
 """
         )
-        for construct_name in sorted(construct_names):
+        for construct_name in sorted_names:
             index_file.write(
                 """\
 * `%s </constructs/construct-%s.html>`_
@@ -437,6 +707,7 @@ of executed code."""
         )
 
 
+@functools.lru_cache(maxsize=None)
 def getPythonVersion(python):
     version_output = subprocess.check_output(
         (
@@ -449,30 +720,43 @@ print(("x86_64" if "AMD64" in sys.version else "x86") if os.name=="nt" else os.u
 """,
         ),
         stderr=subprocess.STDOUT,
+        text=True,
     )
 
-    python_version = version_output.split(b"\n")[0].strip()
-    python_arch = version_output.split(b"\n")[1].strip()
+    # First line is the version, second one the architecture, which is not
+    # currently used.
+    return version_output.splitlines()[0].strip()
 
-    if sys.version.startswith("3"):
-        python_arch = python_arch.decode()
-        python_version = python_version.decode()
 
-    return python_version
+@functools.lru_cache(maxsize=1)
+def _getBranchCommitIds():
+    # One git call resolves all interesting branches, no GitPython import
+    # and Repo construction needed just for the hexshas.
+    output = subprocess.check_output(
+        [
+            "git",
+            "-C",
+            clone_dir,
+            "for-each-ref",
+            "--format=%(refname:short) %(objectname)",
+        ]
+        + ["refs/heads/%s" % work_tree for work_tree in work_trees_to_look_at],
+        text=True,
+    )
 
+    return dict(line.split() for line in output.splitlines())
 
-def getCommitIdFromName(name):
-    from git import Repo
 
-    repo = Repo(os.path.join(git_dir, "Nuitka.git"))
+def getCommitIds(names):
+    branch_commit_ids = _getBranchCommitIds()
 
-    return getattr(repo.heads, name).commit
+    return {name: branch_commit_ids[name] for name in names}
 
 
-def _takeNumbers(name, python, major, filename):
-    case_dir = os.path.join(getDataDir(), major, name)
-    makedirs(case_dir)
-    data_filename = os.path.join(case_dir, filename.replace(".py", ".data"))
+def _startNumbers(name, python, major, filename):
+    data_filename = os.path.join(
+        getDataDir(), major, name, filename.replace(".py", ".data")
+    )
 
     command = [
         python,
@@ -488,177 +772,267 @@ def _takeNumbers(name, python, major, filename):
         os.path.join(getTestCasesDir(), filename),
     ]
 
-    process = subprocess.Popen(
-        args=command, stdout=subprocess.PIPE, stderr=subprocess.PIPE
-    )
+    # Let the child write straight into the data file, no buffering of the
+    # whole output in this process.
+    data_file = open(data_filename, "wb")
 
-    stdout_runner, stderr_runner = process.communicate()
-    exit_runner = process.returncode
+    process = subprocess.Popen(command, stdout=data_file, stderr=subprocess.PIPE)
 
-    assert exit_runner == 0, stderr_runner
-    open(data_filename, "wb").write(stdout_runner)
+    return process, data_file, data_filename
 
 
-def _readNumbers(name, major, filename):
-    data_filename = os.path.join(
-        getDataDir(), major, name, filename.replace(".py", ".data")
-    )
+def _takeNumbers(names, python, major, filename):
+    # The branch worktrees and output files are independent, run all the
+    # missing measurements of one case at the same time.
+    running = [
+        (name,) + _startNumbers(name, python, major, filename) for name in names
+    ]
+
+    for name, process, data_file, data_filename in running:
+        _, stderr_runner = process.communicate()
+        data_file.close()
+
+        if process.returncode != 0:
+            # Do not leave a partial data file behind.
+            os.unlink(data_filename)
 
-    return readDataFile(data_filename)
+        assert process.returncode == 0, (name, stderr_runner)
 
 
-def _validate(values, test_case_hash, commit):
+def _validate(values, test_case_hash, commit_id):
     if values is None:
         return None
     if (
         values.get("TEST_CASE_HASH") != test_case_hash
-        or values.get("NUITKA_COMMIT") != commit.hexsha
+        or values.get("NUITKA_COMMIT") != commit_id
     ):
         return None
 
     return values
 
 
+@functools.lru_cache(maxsize=None)
 def getTestCasesDir():
     return os.path.join(getNuitkaWorkTreeDir("factory"), "tests/benchmarks/constructs")
 
 
+def _processCase(filename, test_case_hash, python, python_version, major, commit_ids):
+    fullpath = os.path.join(getTestCasesDir(), filename)
+
+    print("Consider:", filename)
+    sys.stdout.flush()
+
+    needs_cpython = False
+
+    # Compute the per-case path pieces once, they are reused for every
+    # branch below.
+    version_data_dir = os.path.join(getDataDir(), major)
+    data_entry_name = filename.replace(".py", ".data")
+
+    cpython_filename = os.path.join(version_data_dir, "cpython", data_entry_name)
+
+    if os.path.exists(cpython_filename):
+        old_values = readDataFile(cpython_filename)
+
+        if (
+            old_values["TEST_CASE_HASH"] != test_case_hash
+            or old_values["PYTHON"] != python_version
+        ):
+            needs_cpython = True
+    else:
+        needs_cpython = True
+
+    branch_values = {
+        name: _validate(
+            readDataFile(os.path.join(version_data_dir, name, data_entry_name)),
+            test_case_hash,
+            commit_ids[name],
+        )
+        for name in ("factory", "develop", "main")
+    }
+
+    if needs_cpython:
+        print("CPython ... ")
+
+        command = [
+            python,
+            os.path.join(
+                getNuitkaWorkTreeDir("factory"), "bin/measure-construct-performance"
+            ),
+            fullpath,
+            "--copy-source-to",
+            getSourcesDir(),
+        ]
+
+        with open(cpython_filename, "wb") as cpython_file:
+            process = subprocess.run(
+                command, stdout=cpython_file, stderr=subprocess.PIPE
+            )
+
+        if process.returncode != 0:
+            os.unlink(cpython_filename)
+
+        assert process.returncode == 0, process.stderr
+
+    missing_branches = [
+        name for name in ("factory", "develop", "main") if branch_values[name] is None
+    ]
+
+    if missing_branches:
+        print("Nuitka %s ... " % ",".join(missing_branches))
+        _takeNumbers(missing_branches, python, major, filename)
+
+    # Report if any measurement was actually taken, and give the values
+    # parsed in this worker back to the parent cache.
+    return needs_cpython or bool(missing_branches), _takeDataFileCacheUpdates()
+
+
 def _updateNumbers(python):
     python_version = getPythonVersion(python)
     major = ".".join(python_version.split(".")[:2])
 
     print("Working with", major)
 
-    nuitka_factory_commit = getCommitIdFromName("factory")
-    nuitka_develop_commit = getCommitIdFromName("develop")
-    nuitka_main_commit = getCommitIdFromName("main")
+    commit_ids = getCommitIds(work_trees_to_look_at)
+
+    # All measurement output lands in these directories, create them once
+    # here instead of re-checking for every single case.
+    version_data_dir = os.path.join(getDataDir(), major)
+
+    for name in work_trees_to_look_at + ("cpython",):
+        makedirs(os.path.join(version_data_dir, name))
 
     cases_dir = getTestCasesDir()
 
-    for filename in sorted(os.listdir(cases_dir)):
+    case_filenames = []
+
+    with os.scandir(cases_dir) as scan:
+        case_entries = sorted(scan, key=lambda entry: entry.name)
+
+    for case_entry in case_entries:
+        filename = case_entry.name
+
         # TODO: Is this still valid?
         if filename == "InplaceOperationInstanceStringAdd.py":
             continue
 
-        fullpath = os.path.join(cases_dir, filename)
-
         if not filename.endswith(".py"):
             continue
         if filename.startswith("run_"):
             continue
-        if not os.path.isfile(fullpath):
+        if not case_entry.is_file():
             continue
 
-        if python_version.startswith("3") and filename.endswith("_27.py"):
+        if python_version[:1] == "3" and filename.endswith("_27.py"):
             continue
 
         if major in ("2.6", "2.7", "3.4") and filename.endswith("35.py"):
             continue
 
-        print("Consider:", filename)
-        sys.stdout.flush()
+        case_filenames.append(filename)
 
-        needs_cpython = False
+    # Test case hashes are cached by (mtime, size), so unchanged cases do
+    # not get read and hashed again on every run.
+    case_index_filename = os.path.join(cache_dir, "case_index.json")
 
-        test_case_hash = hashlib.md5(open(fullpath, "rb").read()).hexdigest()
-
-        cpython_filename = os.path.join(
-            getDataDir(), major, "cpython", filename.replace(".py", ".data")
-        )
+    try:
+        with open(case_index_filename) as index_file:
+            case_index = json.load(index_file)
+    except (IOError, ValueError):
+        case_index = {}
 
-        if os.path.exists(cpython_filename):
-            old_values = readDataFile(cpython_filename)
+    case_hashes = {}
 
-            if (
-                old_values["TEST_CASE_HASH"] != test_case_hash
-                or old_values["PYTHON"] != python_version
-            ):
-                needs_cpython = True
-        else:
-            needs_cpython = True
-
-        factory_values = _readNumbers("factory", major, filename)
-        factory_values = _validate(
-            factory_values, test_case_hash, nuitka_factory_commit
-        )
-
-        develop_values = _readNumbers("develop", major, filename)
-        develop_values = _validate(
-            develop_values, test_case_hash, nuitka_develop_commit
-        )
-
-        main_values = _readNumbers("main", major, filename)
-        main_values = _validate(main_values, test_case_hash, nuitka_main_commit)
+    for filename in case_filenames:
+        fullpath = os.path.join(cases_dir, filename)
+        file_stat = os.stat(fullpath)
 
-        if needs_cpython:
-            print("CPython ... ")
-            makedirs(os.path.dirname(cpython_filename))
+        index_entry = case_index.get(filename)
 
-            command = [
-                python,
-                os.path.join(
-                    getNuitkaWorkTreeDir("factory"), "bin/measure-construct-performance"
+        if (
+            index_entry is not None
+            and index_entry["mtime"] == file_stat.st_mtime_ns
+            and index_entry["size"] == file_stat.st_size
+        ):
+            case_hashes[filename] = index_entry["hash"]
+        else:
+            case_hashes[filename] = getFileHash(fullpath)
+
+            case_index[filename] = {
+                "mtime": file_stat.st_mtime_ns,
+                "size": file_stat.st_size,
+                "hash": case_hashes[filename],
+            }
+
+    with open(case_index_filename, "w") as index_file:
+        json.dump(case_index, index_file)
+
+    # The cases are entirely independent of one another, spread them over
+    # the available cores.
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        case_results = list(
+            executor.map(
+                functools.partial(
+                    _processCase,
+                    python=python,
+                    python_version=python_version,
+                    major=major,
+                    commit_ids=commit_ids,
                 ),
-                fullpath,
-                "--copy-source-to",
-                getSourcesDir(),
-            ]
-
-            process = subprocess.Popen(
-                args=command, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+                case_filenames,
+                (case_hashes[filename] for filename in case_filenames),
             )
+        )
 
-            stdout_runner, stderr_runner = process.communicate()
-            exit_runner = process.returncode
-
-            assert exit_runner == 0, stderr_runner
-
-            open(cpython_filename, "wb").write(stdout_runner)
-
-        if factory_values is None:
-            print("Nuitka factory ... ")
-            _takeNumbers("factory", python, major, filename)
+    measured = False
 
-        if develop_values is None:
-            print("Nuitka develop ... ")
-            _takeNumbers("develop", python, major, filename)
+    for case_measured, cache_updates in case_results:
+        measured = measured or case_measured
 
-        if main_values is None:
-            print("Nuitka main ... ")
-            _takeNumbers("main", python, major, filename)
+        _mergeDataFileCacheUpdates(cache_updates)
 
-    version_data_dir = os.path.join(getDataDir(), major)
+    # Membership test against the one directory listing taken above, no
+    # stat syscall per data file.
+    existing_case_names = frozenset(entry.name for entry in case_entries)
 
-    for branch_name in sorted(os.listdir(version_data_dir)):
-        branch_path = os.path.join(version_data_dir, branch_name)
+    with os.scandir(version_data_dir) as scan:
+        branch_entries = sorted(scan, key=lambda entry: entry.name)
 
-        if not os.path.isdir(branch_path):
+    for branch_entry in branch_entries:
+        if not branch_entry.is_dir():
             continue
 
-        for filename in sorted(os.listdir(branch_path)):
+        with os.scandir(branch_entry.path) as scan:
+            data_entries = sorted(scan, key=lambda entry: entry.name)
 
-            fullpath = os.path.join(branch_path, filename)
+        for data_entry in data_entries:
+            filename = data_entry.name
 
             if filename.endswith((".data", ".html")):
                 case_name = filename[:-5] + ".py"
 
-                case_filename = os.path.join(cases_dir, case_name)
-                if not os.path.exists(case_filename):
-                    print("Removing obsolete:", fullpath)
-                    os.unlink(fullpath)
+                if case_name not in existing_case_names:
+                    print("Removing obsolete:", data_entry.path)
+                    os.unlink(data_entry.path)
 
             else:
                 assert False
 
+    return measured
+
 
 def updateNumbers():
     print("Updating numbers:")
 
-    _updateNumbers("python3.10")
-    _updateNumbers("python3.11")
-    _updateNumbers("python3.12")
-    #    _updateNumbers("python3.8")
-    _updateNumbers("python2.7")
+    measured = False
+
+    measured = _updateNumbers("python3.10") or measured
+    measured = _updateNumbers("python3.11") or measured
+    measured = _updateNumbers("python3.12") or measured
+    #    measured = _updateNumbers("python3.8") or measured
+    measured = _updateNumbers("python2.7") or measured
+
+    return measured
 
 
 def reportNumbers():
@@ -780,11 +1154,21 @@ When given, all is updated. Default %default.""",
     if not os.path.isdir("doc/images"):
         fetchDocs()
 
+    dirty = False
+
     if options.nuitka:
-        updateNuitkaSoftware()
+        dirty = updateNuitkaSoftware() or dirty
 
     if options.numbers:
-        updateNumbers()
+        dirty = updateNumbers() or dirty
+
+    # For the typical cron driven --update-all run, nothing new means the
+    # graphs and the site are already current.
+    if options.all and not dirty:
+        print("No changes found, skipping graph and site rebuild.")
+
+        options.graph = False
+        options.build = False
 
     if options.show:
         reportNumbers()
@@ -807,6 +1191,8 @@ When given, all is updated. Default %default.""",
     if options.deploy:
         runNikolaCommand("deploy")
 
+    saveDataFileCache()
+
 
 if __name__ == "__main__":
     print("Running with %s" % sys.executable)